@@ -925,23 +925,22 @@ class VertexSetWrappingSequenceBitPacking(VertexSetWrappingSequence):
             # be able to handle keys outside the chosen key type.
             # Where NoGraphs inlines the method, this problem does not occur.
             return False
-        sequence_key, bit_number = divmod(key, 8)
+        # (Shifting and masking is equivalent to divmod(key, 8), but faster)
         try:
-            value = self._sequence[sequence_key]
+            value = self._sequence[key >> 3]
         except IndexError:
             return False
-        return (value != 0) and (value & (1 << bit_number)) != 0
+        return (value != 0) and (value & (1 << (key & 7))) != 0
 
     def __iter__(self) -> Iterator[NonNegativeDenseInt]:
         value_high = 0
         for sequence_value in self._sequence:
-            if sequence_value != 0:
-                for (
-                    value_low,
-                    bit_mask,
-                ) in enumerate((1, 2, 4, 8, 16, 32, 64, 128)):
-                    if sequence_value & bit_mask:
-                        yield value_high + value_low
+            # Only the set bits are visited: the lowest one is isolated, reported,
+            # and cleared, until no bit is left.
+            while sequence_value:
+                lowest_bit = sequence_value & -sequence_value
+                yield value_high + lowest_bit.bit_length() - 1
+                sequence_value ^= lowest_bit
             value_high += 8
 
     def __len__(self) -> int:
@@ -952,16 +951,16 @@ class VertexSetWrappingSequenceBitPacking(VertexSetWrappingSequence):
 
     def add(self, key: NonNegativeDenseInt) -> None:
         sequence = self._sequence
-        sequence_key, bit_number = divmod(key, 8)
-        bit_mask = 1 << bit_number
+        sequence_key = key >> 3
+        bit_mask = 1 << (key & 7)
         try:
             sequence[sequence_key] = sequence[sequence_key] | bit_mask
         except IndexError:
             self.extend_and_set(sequence_key, bit_mask)
 
     def discard(self, key: NonNegativeDenseInt) -> None:
-        sequence_key, bit_number = divmod(key, 8)
-        bit_mask = 255 - (1 << bit_number)
+        sequence_key = key >> 3
+        bit_mask = 255 - (1 << (key & 7))
         sequence = self._sequence
         try:
             sequence[sequence_key] = sequence[sequence_key] & bit_mask
@@ -971,8 +970,8 @@ class VertexSetWrappingSequenceBitPacking(VertexSetWrappingSequence):
     def update_from_keys(self, keys: Iterable[NonNegativeDenseInt]) -> None:
         sequence = self._sequence
         for key in keys:
-            sequence_key, bit_number = divmod(key, 8)
-            bit_mask = 1 << bit_number
+            sequence_key = key >> 3
+            bit_mask = 1 << (key & 7)
             try:
                 sequence[sequence_key] = sequence[sequence_key] | bit_mask
             except IndexError:
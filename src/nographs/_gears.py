@@ -17,7 +17,6 @@ from typing import (
 from typing import Tuple
 from abc import abstractmethod
 from array import array
-from itertools import repeat
 from decimal import Decimal
 
 from ._types import (
@@ -549,7 +548,7 @@ class GearForIntVertexIDs(
             extend_by_template = True
 
             def sequence_factory() -> SequenceForGearProto[int, int, int]:
-                return array("B", repeat(0, pre_allocate))
+                return array("B", (0,)) * pre_allocate
 
         collection_class = (
             VertexSetWrappingSequenceNoBitPacking
@@ -607,10 +606,7 @@ class GearForIntVertexIDs(
         # This implementation is limited to 2^32 values, meaning 2^31 vertices
         # when numbering enter and leave events, thus 2.147.483.648 vertices.
         return VertexMappingWrappingSequenceWithoutNone[int](
-            lambda: array(
-                "L",
-                repeat(0, self._pre_allocate),
-            ),
+            lambda: array("L", (0,)) * self._pre_allocate,
             0,
             1024,
             True,
@@ -703,10 +699,8 @@ class GearForIntVertexIDsAndCFloats(GearForIntVertexIDs[T_vertex, float, T_label
         self, initial_content: Iterable[Tuple[IntVertexID, float]]
     ) -> VertexMapping[IntVertexID, float]:
         return VertexMappingWrappingSequenceWithoutNone[float](
-            lambda: array(
-                self.distance_type_code,
-                repeat(self._infinity_value, self._pre_allocate),
-            ),
+            lambda: array(self.distance_type_code, (self._infinity_value,))
+            * self._pre_allocate,
             self._infinity_value,
             1024,
             True,
@@ -752,10 +746,8 @@ class GearForIntVertexIDsAndCInts(GearForIntVertexIDs[T_vertex, int, T_labels]):
         self, initial_content: Iterable[Tuple[IntVertexID, int]]
     ) -> VertexMapping[IntVertexID, int]:
         return VertexMappingWrappingSequenceWithoutNone[int](
-            lambda: array(
-                self.distance_type_code,
-                repeat(self._infinity_value, self._pre_allocate),
-            ),
+            lambda: array(self.distance_type_code, (self._infinity_value,))
+            * self._pre_allocate,
             self._infinity_value,
             1024,
             True,
@@ -820,9 +812,8 @@ class GearForIntVerticesAndIDs(GearForIntVertexIDs[IntVertexID, T_weight, T_labe
         max_vertex_type_value = 256**bytes_of_vertex_type_code - 1
 
         return VertexMappingWrappingSequenceWithoutNone[IntVertexID](
-            lambda: array(
-                self.vertex_type_code, repeat(max_vertex_type_value, self._pre_allocate)
-            ),
+            lambda: array(self.vertex_type_code, (max_vertex_type_value,))
+            * self._pre_allocate,
             max_vertex_type_value,
             1024,
             True,
@@ -931,10 +922,8 @@ class GearForIntVerticesAndIDsAndCFloats(GearForIntVerticesAndIDs[float, T_label
         self, initial_content: Iterable[Tuple[IntVertexID, float]]
     ) -> VertexMapping[IntVertexID, float]:
         return VertexMappingWrappingSequenceWithoutNone[float](
-            lambda: array(
-                self.distance_type_code,
-                repeat(self._infinity_value, self._pre_allocate),
-            ),
+            lambda: array(self.distance_type_code, (self._infinity_value,))
+            * self._pre_allocate,
             self._infinity_value,
             1024,
             True,
@@ -987,10 +976,8 @@ class GearForIntVerticesAndIDsAndCInts(GearForIntVerticesAndIDs[int, T_labels]):
         self, initial_content: Iterable[Tuple[IntVertexID, int]]
     ) -> VertexMapping[IntVertexID, int]:
         return VertexMappingWrappingSequenceWithoutNone[int](
-            lambda: array(
-                self.distance_type_code,
-                repeat(self._infinity_value, self._pre_allocate),
-            ),
+            lambda: array(self.distance_type_code, (self._infinity_value,))
+            * self._pre_allocate,
             self._infinity_value,
             1024,
             True,
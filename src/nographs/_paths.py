@@ -43,7 +43,10 @@ class Paths(ABC, Generic[T_vertex, T_vertex_id, T_labels]):
     A path can be iterated in forward direction, i.e., from a start vertex to
     the given vertex, or in the backward direction. The forward iteration is
     implemented based on the backward iteration by creating a copy of the
-    path. Thus, it is slower and needs additional memory.
+    path. Thus, it is slower and needs additional memory. If only the last
+    *k* vertices or edges of a long path are needed, iterating backwards, e.g.,
+    by *itertools.islice(paths.iter_vertices_to_start(vertex), k)*, takes time and
+    memory proportional to *k* instead of the length of the path.
 
     Class Paths and its subclasses are not intended to be instantiated by application
     code. On demand, the `traversal strategies <traversal_api>` of the library
@@ -364,7 +367,26 @@ class PathsOfUnlabeledEdges(Paths[T_vertex, T_vertex_id, Any]):
 
         :param vertex: The path ending at this vertex will be returned.
         """
-        return tuple(self.iter_vertices_from_start(vertex))
+        # The loop of iter_vertices_to_start is inlined here, and the list of
+        # vertices is reversed in place, for improved speed.
+        vertex_id = self._check_vertex(vertex)
+        predecessor_collection = self._predecessor_collection
+        vertex_to_id = self._vertex_to_id
+
+        path = [vertex]
+        append_to_path = path.append
+        while True:
+            from_vertex = predecessor_collection[vertex_id]
+            if vertex == from_vertex:
+                break  # self loop denotes empty path / end of the path
+            assert from_vertex is not None  # prefixes of paths are always paths
+            vertex = from_vertex
+            append_to_path(vertex)
+            vertex_id = (
+                vertex_to_id(vertex) if vertex_to_id else cast(T_vertex_id, vertex)
+            )  # See comment about the cast in __contains__
+        path.reverse()
+        return tuple(path)
 
 
 class PathsOfLabeledEdges(Paths[T_vertex, T_vertex_id, T_labels]):
@@ -1,4 +1,3 @@
-import itertools
 from typing import Optional, Iterable, Generic, ClassVar
 
 from nographs._types import (
@@ -57,7 +56,8 @@ class BSearchBreadthFirstFlex(Strategy[T_vertex, T_vertex_id, T_labels]):
       the given labels.
 
     **Algorithm:** Bidirectional version of the Breadth First Search algorithm,
-    non-recursive, based on FIFO queues.
+    non-recursive, based on FIFO queues. Depth level by depth level, the search
+    continues in the direction with fewer vertices to expand next.
 
     **Properties:** In both directions, vertices are visited by increasing depth
     from a start (resp. a goal) vertex (minimal number of edges), till a shortest
@@ -256,33 +256,45 @@ class BSearchBreadthFirstFlex(Strategy[T_vertex, T_vertex_id, T_labels]):
 
         # ----- Inner loop -----
 
-        for (
-            traversal_iter,
-            visited_other,
-            visited_other_uses_sequence,
-            visited_other_sequence,
-            visited_other_uses_bits,
-            visited_other_index_and_bit_method,
-        ) in itertools.cycle(
+        directions = (
             (
-                (
-                    iter(self._traversal_bi[0]),
-                    visited_bi[1],
-                    visited_backwards_uses_sequence,
-                    visited_backwards_sequence,
-                    visited_backwards_uses_bits,
-                    visited_backwards_index_and_bit_method,
-                ),
-                (
-                    iter(self._traversal_bi[1]),
-                    visited_bi[0],
-                    visited_forwards_uses_sequence,
-                    visited_forwards_sequence,
-                    visited_forwards_uses_bits,
-                    visited_forwards_index_and_bit_method,
-                ),
-            )
-        ):
+                iter(self._traversal_bi[0]),
+                visited_bi[1],
+                visited_backwards_uses_sequence,
+                visited_backwards_sequence,
+                visited_backwards_uses_bits,
+                visited_backwards_index_and_bit_method,
+            ),
+            (
+                iter(self._traversal_bi[1]),
+                visited_bi[0],
+                visited_forwards_uses_sequence,
+                visited_forwards_sequence,
+                visited_forwards_uses_bits,
+                visited_forwards_index_and_bit_method,
+            ),
+        )
+        # Number of vertices of the depth level that has been reported last by the
+        # traversal in the respective direction, i.e., of the vertices it will
+        # expand next. (0: Not known yet, since the traversal has not started.)
+        level_sizes = [0, 0]
+
+        while True:
+            # Greedy alternation: Continue the traversal with the smaller set of
+            # vertices to expand (forwards, in case of a tie). Then, a direction
+            # with a fast-growing frontier does not dominate the costs. Since both
+            # traversals always complete a depth level, the first common vertex is
+            # still on a shortest path.
+            direction = 0 if level_sizes[0] <= level_sizes[1] else 1
+            (
+                traversal_iter,
+                visited_other,
+                visited_other_uses_sequence,
+                visited_other_sequence,
+                visited_other_uses_bits,
+                visited_other_index_and_bit_method,
+            ) = directions[direction]
+            level_size = 0
             prev_vertex: Optional[T_vertex] = None
             for vertex in traversal_iter:
                 # If we get the same vertex twice, directly after each other,
@@ -291,6 +303,7 @@ class BSearchBreadthFirstFlex(Strategy[T_vertex, T_vertex_id, T_labels]):
                 if prev_vertex == vertex:
                     break
                 prev_vertex = vertex
+                level_size += 1
 
                 # If vertex is not in visited vertices of other traversal: continue
                 v_id: T_vertex_id = (
@@ -336,6 +349,7 @@ class BSearchBreadthFirstFlex(Strategy[T_vertex, T_vertex_id, T_labels]):
                 # No new vertices reported by traversal in this direction and depth:
                 # Whole search is over.
                 break
+            level_sizes[direction] = level_size
 
         if fail_silently:
             return -1, path_cls.of_nothing()
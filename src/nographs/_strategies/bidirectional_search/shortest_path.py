@@ -77,6 +77,10 @@ class BSearchShortestPathFlex(
     and will be found by the class, whilst TraversalShortestPaths does not report
     start vertices and thus,
     TraversalShortestPaths(<something>).start_at(v).go_to(v) fails.
+
+    Note: If all edges of the graph have the same weight, a path with the
+    minimal number of edges is also a shortest path. Then, `BSearchBreadthFirstFlex`
+    finds such a path with less bookkeeping (no heap, no distance values).
     """
 
     _state_attrs: ClassVar = Strategy._state_attrs
@@ -349,6 +353,9 @@ class BSearchShortestPathFlex(
         best_connecting_node = start_vertices_and_ids_forwards[0][0]
         others_path_weight = zero
 
+        # Get references of used heap functions (avoid global name resolution)
+        heap_pop, heap_push = heappop, heappush
+
         # ----- Loop -----
         for (
             to_visit,
@@ -402,7 +409,7 @@ class BSearchShortestPathFlex(
                 return self._search_failed(path_cls, infinity, fail_silently)
 
             # Visit path with the lowest distance first
-            path_weight, _, vertex = heappop(to_visit)
+            path_weight, _, vertex = heap_pop(to_visit)
 
             # A vertex can get added to the heap multiple times. We want to process
             # it only once, the first time it is removed from the heap, because this
@@ -480,7 +487,7 @@ class BSearchShortestPathFlex(
                         except IndexError:
                             attributes_wrapper.extend_and_set(n_id, data_of_edge)
 
-                heappush(to_visit, (n_path_weight, next(unique_no), neighbor))
+                heap_push(to_visit, (n_path_weight, next(unique_no), neighbor))
 
                 # If we already have an estimation for the distance from the neighbor
                 # to the other end of the search and the resulting total distance
@@ -215,9 +215,9 @@ class Traversal(Strategy[T_vertex, T_vertex_id, T_labels], Iterable[T_vertex]):
                 vertex_set = set(cast(Iterable[T_vertex_id], vertices))
                 v_count = len(vertex_set)
                 if v_count:
-                    for v in self._generator:
-                        if v not in vertex_set:
-                            continue
+                    # (The vertices that are not searched for are skipped by the
+                    # C-level filter, without a step of the loop for each of them)
+                    for v in filter(vertex_set.__contains__, self._generator):
                         yield v
                         v_count -= 1
                         if v_count == 0:
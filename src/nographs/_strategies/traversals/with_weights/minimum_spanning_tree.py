@@ -227,6 +227,9 @@ class TraversalMinimumSpanningTreeFlex(
         ]
         heapify(to_visit)
 
+        # Get references of used heap functions (avoid global name resolution)
+        heap_pop, heap_push = heappop, heappush
+
         # Prepare limit check done by zero check
         if calculation_limit is not None:
             calculation_limit += 1
@@ -245,7 +248,7 @@ class TraversalMinimumSpanningTreeFlex(
 
         while to_visit:
             # Visit edge with the lowest weight first
-            _weight, _, vertex, to_edge = heappop(to_visit)
+            _weight, _, vertex, to_edge = heap_pop(to_visit)
             to_vertex = to_edge[0]
 
             # A vertex can get added to the heap multiple times, as end vertex of
@@ -345,7 +348,7 @@ class TraversalMinimumSpanningTreeFlex(
                     except IndexError:
                         pass
 
-                heappush(
+                heap_push(
                     to_visit,
                     (n_weight, next(unique_no), to_vertex, n_to_edge),
                 )
@@ -64,7 +64,7 @@ class StrRepr:
         The result is independent of the methods repr() and str() of the
         *MutableSet*. (The elements do not need to be hashable.)
         """
-        return cls("{" + ", ".join(sorted(repr(k) for k in c)) + "}")
+        return cls("{" + ", ".join(sorted(map(repr, c))) + "}")
 
     def __repr__(self) -> str:
         return self.s
@@ -150,6 +150,10 @@ class GearCollectionFunctionalityMainlyOnlyForAppCode:
     ...     list_factory, 128, False, [4])
     >>> ws.__or__(ws2)  # Calls _from_iterable(iterable) to create new set
     {1, 2, 4, 1032}
+    >>> ws3 = nog.VertexSetWrappingSequenceBitPacking(
+    ...     list_factory, 128, False, range(6, 18))  # All bits of a byte, and more
+    >>> list(ws3)
+    [6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17]
 
     About the previous test:
     MyPyC: "ws | ws2" raises:
@@ -1,16 +1,16 @@
 import collections
+import functools
+import itertools
+import operator
 import textwrap
 import sys
 from abc import abstractmethod, ABC
-from collections.abc import Callable, Hashable, Iterator
+from collections.abc import Callable, Hashable
 from typing import Any, Iterable, Union, TypeVar, Optional, Protocol, Generic
 
 import nographs as nog
 from nographs import T, Strategy, T_vertex, T_vertex_id, T_labels, T_weight
 
-# noinspection PyProtectedMember
-from nographs._compatibility import pairwise
-
 # noinspection PyProtectedMember
 from nographs._strategies.utils import StrRepr  # NOQA F401 (import needed by doc tests)
 
@@ -23,9 +23,13 @@ def eprint(*args: Any, **kwargs: Any) -> None:
     print(*args, file=sys.stderr, **kwargs)
 
 
+# (Created once and reused, instead of creating a new one by each textwrap.fill)
+_text_wrapper = textwrap.TextWrapper(88 - 8, subsequent_indent="  ")
+
+
 def print_filled(s: str) -> None:
     """Wrap output to a length that fits into a doubly indented block"""
-    print(textwrap.fill(s, 88 - 8, subsequent_indent="  "))
+    print(_text_wrapper.fill(s))
 
 
 # ----- Utilities: Test procedures printing traversal and search results -----
@@ -71,11 +75,13 @@ def _results_of_traversal(
     # noinspection PyProtectedMember
     org_dict = {k: getattr(traversal, k) for k in traversal._state_attrs}
     vertices = set(additional_vertices)
+    # (Original paths object is fetched once, and not in each step)
+    org_paths = org_dict["paths"]
     print_filled(f"After start: {traversal.state_to_str(vertices)}")
     for vertex in traversal:
         vertices.add(vertex)
         print_filled(f"-> {vertex}: {traversal.state_to_str([vertex])}")
-        if org_dict["paths"] is not traversal.paths:
+        if org_paths is not traversal.paths:
             print("traversal.paths before and while traversal differ!")
     return sorted(vertices), org_dict
 
@@ -153,13 +159,16 @@ def print_partial_results(
     paths_to: Optional[T_sortable_vertex] = None,
 ) -> None:
     """Completely traverse graph, collect reported vertices, and print the
-    first 5 and the last 5. Print path prefixes and suffixes for vertices given
+    first 5 and the last 6. Print path prefixes and suffixes for vertices given
     as parameter.
+
+    Only the printed vertices are kept, not all the reported ones.
     """
-    vertices = []
-    for vertex in traversal:
-        vertices.append(vertex)
-    print(vertices[:5], vertices[-6:])
+    vertices = iter(traversal)
+    first_vertices = list(itertools.islice(vertices, 5))
+    last_vertices = collections.deque(first_vertices, maxlen=6)
+    last_vertices.extend(vertices)
+    print(first_vertices, list(last_vertices))
     if paths_to is not None:
         path = traversal.paths[paths_to]
         print(tuple(path[:2]), tuple(path[-2:]))
@@ -177,7 +186,11 @@ def check_path(
     """Check if each edge in the path described by the vertex_iterable is
     allowed according to the given next_edges function.
     """
-    for v, w in pairwise(vertex_iterable):
+    # (Pairs of consecutive vertices by tee and zip, in a single pass and without
+    # the generator frame of the pairwise wrapper of the compatibility module)
+    vertices, successors = itertools.tee(vertex_iterable)
+    next(successors, None)
+    for v, w in zip(vertices, successors):
         if w not in (w for w, *more in next_edges(v, None)):
             print("path invalid from", v, "to", w)
             return
@@ -186,69 +199,164 @@ def check_path(
 # ----- Utilities: Creation of adjacency functions that report the search states -----
 
 
-def adj_funcs_bi_from_list(
+AdjFunc = Callable[[T_vertex, Strategy[Any, Any, Any]], Iterable[Any]]
+
+
+def edge_dicts_bi_from_list(
     edge_list: Iterable[nog.AnyFullEdge[T_vertex, Any, Any]],
-    edge_data: bool,
-    report_steps: bool = True,
     vertex_to_key: Callable[[Any], Any] = nog.vertex_as_id,
+    edge_data: Optional[bool] = None,
 ) -> tuple[
-    Callable[[T_vertex, Strategy[Any, Any, Any]], Iterable[Any]],
-    Callable[[T_vertex, Strategy[Any, Any, Any]], Iterable[Any]],
+    dict[Any, tuple[Any, ...]],
+    dict[Any, tuple[Any, ...]],
+    dict[Any, tuple[Any, ...]],
+    dict[Any, tuple[Any, ...]],
 ]:
-    """Create NextEdges function for forward and for backward direction, based
-    on an Iterable of edges. When a vertex is expanded, this is printed to std out,
-    if demanded.
+    """Index the given edges by the keys of their start vertices (dicts for forward
+    direction) and by the keys of their end vertices (dicts for backward direction),
+    in a single pass over the edges.
 
-    If options edge_data is given, weights and/or labels provided in an edge are also
-    given by the generated NextEdges functions. Otherwise, NextVertices functions are
-    generated.
+    Return four dicts: For forward and for backward direction, a dict that stores just
+    the respective other vertex of an edge, and a dict that also stores the further
+    data of the edge (weights and/or labels). The dicts are plain dicts, and the
+    values are tuples, since they are not changed anymore.
+
+    If option edge_data is given, only the dicts that also store the further data
+    (True) or only the dicts that store just the other vertex (False) are filled,
+    and the other two dicts remain empty.
 
     If the vertices in the edge_list are not hashable, the argument to parameter
     vertex_to_key need to be a function that returns a hashable key for a vertex,
     where no two vertices have the same key.
     """
-    edge_dict_forwards = collections.defaultdict[T_vertex, list[Any]](list)
-    edge_dict_backwards = collections.defaultdict[T_vertex, list[Any]](list)
-    if edge_data:
+    vertex_dict_forwards = collections.defaultdict[Any, list[Any]](list)
+    vertex_dict_backwards = collections.defaultdict[Any, list[Any]](list)
+    edge_dict_forwards = collections.defaultdict[Any, list[Any]](list)
+    edge_dict_backwards = collections.defaultdict[Any, list[Any]](list)
+    # (Indexing and slicing instead of star-unpacking, which would create a
+    # list for the further edge data)
+    if edge_data is None:
         for edge in edge_list:
-            v, w, *others = edge
+            v, w, others = edge[0], edge[1], edge[2:]
+            v_key, w_key = vertex_to_key(v), vertex_to_key(w)
+            vertex_dict_forwards[v_key].append(w)
+            vertex_dict_backwards[w_key].append(v)
+            edge_dict_forwards[v_key].append((w, *others))
+            edge_dict_backwards[w_key].append((v, *others))
+    elif edge_data:
+        for edge in edge_list:
+            v, w, others = edge[0], edge[1], edge[2:]
             edge_dict_forwards[vertex_to_key(v)].append((w, *others))
             edge_dict_backwards[vertex_to_key(w)].append((v, *others))
     else:
         for edge in edge_list:
-            v, w, *others = edge
-            edge_dict_forwards[vertex_to_key(v)].append(w)
-            edge_dict_backwards[vertex_to_key(w)].append(v)
+            v, w = edge[0], edge[1]
+            vertex_dict_forwards[vertex_to_key(v)].append(w)
+            vertex_dict_backwards[vertex_to_key(w)].append(v)
+    return (
+        freeze_edge_dict(vertex_dict_forwards),
+        freeze_edge_dict(vertex_dict_backwards),
+        freeze_edge_dict(edge_dict_forwards),
+        freeze_edge_dict(edge_dict_backwards),
+    )
 
+
+def freeze_edge_dict(edge_dict: dict[Any, list[Any]]) -> dict[Any, tuple[Any, ...]]:
+    """Return a plain dict with the lists of the given dict converted to tuples.
+    Tuples need less memory than lists, and they can be iterated a little
+    faster.
+    """
+    return {key: tuple(values) for key, values in edge_dict.items()}
+
+
+def adj_funcs_bi_from_dicts(
+    edge_dict_forwards: dict[Any, tuple[Any, ...]],
+    edge_dict_backwards: dict[Any, tuple[Any, ...]],
+    report_steps: bool = True,
+    vertex_to_key: Callable[[Any], Any] = nog.vertex_as_id,
+) -> tuple[AdjFunc[T_vertex], AdjFunc[T_vertex]]:
+    """Create adjacency function for forward and for backward direction, based
+    on dicts created by *edge_dicts_bi_from_list*. When a vertex is expanded, this
+    is printed to std out, if demanded.
+
+    For vertices without edges, the empty tuple constant is returned. Unlike a
+    list literal, it does not allocate a new object for each call.
+    """
+    # Get method references (avoid attribute resolution in the functions)
+    get_forwards = edge_dict_forwards.get
+    get_backwards = edge_dict_backwards.get
     if report_steps:
 
         def next_edges_forwards(
             vertex: T_vertex, strategy: Strategy[Any, Any, Any]
         ) -> Iterable[Any]:
             print_filled(f"? {vertex}: {strategy.state_to_str([vertex])}")
-            return edge_dict_forwards.get(vertex_to_key(vertex), [])
+            return get_forwards(vertex_to_key(vertex), ())
 
         def next_edges_backwards(
             vertex: T_vertex, strategy: Strategy[Any, Any, Any]
         ) -> Iterable[Any]:
             print_filled(f"?<{vertex}: {strategy.state_to_str([vertex])}")
-            return edge_dict_backwards.get(vertex_to_key(vertex), [])
+            return get_backwards(vertex_to_key(vertex), ())
+
+    elif vertex_to_key is nog.vertex_as_id:
+        # Vertices are their own keys: we do not need to call vertex_to_key
+
+        def next_edges_forwards(
+            vertex: T_vertex, strategy: Strategy[Any, Any, Any]
+        ) -> Iterable[Any]:
+            return get_forwards(vertex, ())
+
+        def next_edges_backwards(
+            vertex: T_vertex, strategy: Strategy[Any, Any, Any]
+        ) -> Iterable[Any]:
+            return get_backwards(vertex, ())
 
     else:
 
         def next_edges_forwards(
             vertex: T_vertex, strategy: Strategy[Any, Any, Any]
         ) -> Iterable[Any]:
-            return edge_dict_forwards.get(vertex_to_key(vertex), [])
+            return get_forwards(vertex_to_key(vertex), ())
 
         def next_edges_backwards(
             vertex: T_vertex, strategy: Strategy[Any, Any, Any]
         ) -> Iterable[Any]:
-            return edge_dict_backwards.get(vertex_to_key(vertex), [])
+            return get_backwards(vertex_to_key(vertex), ())
 
     return next_edges_forwards, next_edges_backwards
 
 
+def adj_funcs_bi_from_list(
+    edge_list: Iterable[nog.AnyFullEdge[T_vertex, Any, Any]],
+    edge_data: bool,
+    report_steps: bool = True,
+    vertex_to_key: Callable[[Any], Any] = nog.vertex_as_id,
+) -> tuple[AdjFunc[T_vertex], AdjFunc[T_vertex]]:
+    """Create NextEdges function for forward and for backward direction, based
+    on an Iterable of edges. When a vertex is expanded, this is printed to std out,
+    if demanded.
+
+    If options edge_data is given, weights and/or labels provided in an edge are also
+    given by the generated NextEdges functions. Otherwise, NextVertices functions are
+    generated.
+
+    If the vertices in the edge_list are not hashable, the argument to parameter
+    vertex_to_key need to be a function that returns a hashable key for a vertex,
+    where no two vertices have the same key.
+    """
+    vertices_forwards, vertices_backwards, edges_forwards, edges_backwards = (
+        edge_dicts_bi_from_list(edge_list, vertex_to_key, edge_data)
+    )
+    if edge_data:
+        return adj_funcs_bi_from_dicts(
+            edges_forwards, edges_backwards, report_steps, vertex_to_key
+        )
+    return adj_funcs_bi_from_dicts(
+        vertices_forwards, vertices_backwards, report_steps, vertex_to_key
+    )
+
+
 # ----- Test fixtures (here: graphs and special vertices -----
 
 
@@ -305,19 +413,25 @@ class FixtureFull(Fixture[V, W, L]):
 
         self.start_bi = (start, goal)
 
+        # The edges are indexed only once, for the functions with and without
+        # edge data
+        vertices_forwards, vertices_backwards, edges_forwards, edges_backwards = (
+            edge_dicts_bi_from_list(edges, vertex_to_key)
+        )
+
         self.next_vertices_bi: tuple[
             Callable[[T_vertex, Strategy[Any, Any, Any]], Iterable[E[V, W, L]]],
             Callable[[T_vertex, Strategy[Any, Any, Any]], Iterable[E[V, W, L]]],
-        ] = adj_funcs_bi_from_list(
-            edges, edge_data=False, report_steps=report, vertex_to_key=vertex_to_key
+        ] = adj_funcs_bi_from_dicts(
+            vertices_forwards, vertices_backwards, report, vertex_to_key
         )
         self.next_vertices = self.next_vertices_bi[0]
 
         self.next_edges_bi: tuple[
             Callable[[T_vertex, Strategy[Any, Any, Any]], Iterable[E[V, W, L]]],
             Callable[[T_vertex, Strategy[Any, Any, Any]], Iterable[E[V, W, L]]],
-        ] = adj_funcs_bi_from_list(
-            edges, edge_data=True, report_steps=report, vertex_to_key=vertex_to_key
+        ] = adj_funcs_bi_from_dicts(
+            edges_forwards, edges_backwards, report, vertex_to_key
         )
         self.next_edges = self.next_edges_bi[0]
 
@@ -487,6 +601,21 @@ class FBSearchShortestPath(FixtureFull[int, int, int]):
         )
 
 
+class FBSearchBreadthFirst(FixtureFull[int, int, int]):
+    """Additional test graph for BSearchBreadthFirst: Many edges start at the start
+    vertex, and the goal vertex can only be reached by a chain of vertices."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            [(0, 1), (0, 2), (0, 3), (0, 4), (1, 5), (5, 6), (6, 7)]
+            + [(v, v + 10) for v in (2, 3, 4)],
+            0,
+            7,
+            lambda v: 0,
+            report=True,
+        )
+
+
 class FSmallBinaryTree(FixtureFull[int, int, int]):
     """Graphs forming a binary tree with just 6 vertices. Outgoing edges are sorted
     by ascending weight."""
@@ -595,6 +724,28 @@ class FMultiStartB(FixtureFull[int, int, int]):
         self.start_vertices_bi = (self.start_vertices, self.goal_vertices)
 
 
+@functools.lru_cache(maxsize=4096)
+def _spiral_edges(i: int) -> tuple[tuple[int, int, int], ...]:
+    """Outgoing edges of vertex *i* in graph FSpiral. The results are cached, since
+    the graph is traversed again and again for the different gears.
+    """
+    j = (i + i // 6) % 6
+    first_edge = (i + 1, j * 2 + 1, j * 2 + 1)
+    if i % 2 == 0:
+        return first_edge, (i + 6, 7 - j, 7 - j)
+    elif i % 1200000 > 5:
+        return first_edge, (i - 6, 1, 1)
+    return (first_edge,)
+
+
+@functools.lru_cache(maxsize=4096)
+def _spiral_edges_sorted(i: int) -> tuple[tuple[int, int, int], ...]:
+    """Like _spiral_edges, but the edges are sorted by ascending weight. The sorting
+    is done only once per vertex.
+    """
+    return tuple(sorted(_spiral_edges(i), key=operator.itemgetter(1)))
+
+
 class FSpiral(Fixture[int, int, int]):
     """Graph for testing TraversalShortestPathsFlex with all gears.
     Outgoing edges are sorted by ascending weight.
@@ -602,12 +753,7 @@ class FSpiral(Fixture[int, int, int]):
 
     @staticmethod
     def next_edges(i: int, _: Any) -> Iterable[tuple[int, int, int]]:
-        j = (i + i // 6) % 6
-        yield i + 1, j * 2 + 1, j * 2 + 1
-        if i % 2 == 0:
-            yield i + 6, 7 - j, 7 - j
-        elif i % 1200000 > 5:
-            yield i - 6, 1, 1
+        return _spiral_edges(i)
 
     def __init__(self) -> None:
         super().__init__(0)
@@ -620,9 +766,7 @@ class FSpiralSorted(FSpiral):
 
     @staticmethod
     def next_edges(i: int, _: Any) -> Iterable[tuple[int, int, int]]:
-        out_edges = list(super(FSpiralSorted, FSpiralSorted).next_edges(i, None))
-        out_edges.sort(key=lambda e: e[1])
-        return out_edges
+        return _spiral_edges_sorted(i)
 
 
 class FOvertaking(FixtureFull[int, int, int]):
@@ -637,13 +781,17 @@ class FOvertaking(FixtureFull[int, int, int]):
         limit = 4 * _enough_for_index_error
         self.last_vertex = limit + 2
 
-        edges = []
-        for v in range(0, limit, 2):
-            edges.append((v, v + 1, 1, 1))
-            edges.append((v, v + 3, 1, 3))
-        for v in range(1, limit, 2):
-            edges.append((v, v + 3, 1, 1))
-            edges.append((v, v + 1, 1, 3))
+        # (Comprehensions instead of loops with calls of append)
+        edges = [
+            edge
+            for v in range(0, limit, 2)
+            for edge in ((v, v + 1, 1, 1), (v, v + 3, 1, 3))
+        ]
+        edges.extend(
+            edge
+            for v in range(1, limit, 2)
+            for edge in ((v, v + 3, 1, 1), (v, v + 1, 1, 3))
+        )
 
         super().__init__(edges, 0, goal, lambda v: 0, report=False)
 
@@ -659,14 +807,16 @@ class FOvertakingDFSWithBackEdges(FixtureFull[int, int, int]):
         limit = 3 * _enough_for_index_error
         self.last_vertex = limit + 2
 
-        edges = []
-        for v in range(0, limit, 2):
-            edges.append((v, v + 1, 1, 1))
-            edges.append((v, v + 3, 3, 3))
-        for v in range(1, limit, 2):
-            edges.append((v, v // 2, 8, 8))
-            edges.append((v, v + 3, 1, 1))
-            edges.append((v, v + 1, 3, 3))
+        edges = [
+            edge
+            for v in range(0, limit, 2)
+            for edge in ((v, v + 1, 1, 1), (v, v + 3, 3, 3))
+        ]
+        edges.extend(
+            edge
+            for v in range(1, limit, 2)
+            for edge in ((v, v // 2, 8, 8), (v, v + 3, 1, 1), (v, v + 1, 3, 3))
+        )
 
         super().__init__(edges, 0, goal, lambda v: 0, report=False)
 
@@ -698,10 +848,17 @@ class FBinaryTreeFixedWeights(Fixture[int, int, int]):
         self.goal = 2 * _enough_for_index_error
         _limit = 3 * self.goal
 
-        def next_edges(i: int, _: Any) -> Iterator[tuple[int, int, int]]:
+        # The fixture is traversed again and again for the different gears and
+        # strategies. So, the out-edges of each vertex are computed only once.
+        # (The tree is finite, so the size of the cache is limited.)
+        @functools.lru_cache(maxsize=None)
+        def tree_edges(i: int) -> tuple[tuple[int, int, int], ...]:
             if i < _limit:
-                yield 2 * i + 0, 1, 1
-                yield 2 * i + 1, 1, 3
+                return (2 * i + 0, 1, 1), (2 * i + 1, 1, 3)
+            return ()
+
+        def next_edges(i: int, _: Any) -> Iterable[tuple[int, int, int]]:
+            return tree_edges(i)
 
         self.next_edges = next_edges
         super().__init__(1)
@@ -1923,6 +2080,19 @@ class NormalGraphTraversalsWithOrWithoutLabels:
         ?<3: {'depth': 0, 'visited': {3}, 'paths': {3: (3,)}}
         >>> print(l, list(p))
         2 [0, 1, 3]
+
+        The search continues in the direction with fewer vertices to expand next:
+        After the first depth level in both directions, only the backward search
+        expands vertices, since it has only one vertex to expand in each depth.
+        >>> fbs = FBSearchBreadthFirst()
+        >>> search = nog.BSearchBreadthFirst(fbs.next_vertices_bi)
+        >>> l, p = search.start_from(fbs.start_bi, build_path=True)
+        ? 0: {'depth': 0, 'visited': {0}, 'paths': {0: (0,)}}
+        ?<7: {'depth': 0, 'visited': {7}, 'paths': {7: (7,)}}
+        ?<6: {'depth': 1, 'visited': {6, 7}, 'paths': {6: (7, 6)}}
+        ?<5: {'depth': 2, 'visited': {5, 6, 7}, 'paths': {5: (7, 6, 5)}}
+        >>> print(l, list(p))
+        4 [0, 1, 5, 6, 7]
         """
         pass
 
@@ -3897,8 +4067,8 @@ class GearTestsTraversalsWithOrWithoutLabels:
     -- TraversalShortestPathsFlex and TraversalBreadthFirstFlex
     with all kinds of gears --
 
+    >>> f = FSpiral()
     >>> def gear_test(gear):
-    ...    f = FSpiral()
     ...    traversal = nog.TraversalShortestPathsFlex(nog.vertex_as_id,
     ...        gear, next_labeled_edges=f.next_edges)
     ...    vertex = traversal.start_from(f.start, build_paths=True).go_to(f.goal)
@@ -3982,8 +4152,8 @@ class GearTestsTraversalsWithOrWithoutLabels:
     -- TraversalShortestPathsInfBranchingSortedFlex with gears for Hashable --
     (output of TraversalShortestPathsFlex also shown, as comparison)
 
+    >>> f = FSpiralSorted()
     >>> def gear_test(gear):
-    ...    f = FSpiralSorted()
     ...    traversal = nog.TraversalShortestPathsFlex(nog.vertex_as_id,
     ...        gear, next_labeled_edges=f.next_edges)
     ...    vertex = traversal.start_from(f.start, build_paths=True).go_to(f.goal)
@@ -200,6 +200,9 @@ class TraversalAStarFlex(
         # fastest).
         unique_no = itertools.count(256, -1)
 
+        # Get references of used heap functions (avoid global name resolution)
+        heap_pop, heap_push = heappop, heappush
+
         # Get references of used gear objects and methods (avoid attribute resolution)
         distances = self.distances
         "$$ MVertexMapping.access(name='distances') $$"
@@ -244,7 +247,7 @@ class TraversalAStarFlex(
 
         while to_visit:
             # Visit path with the lowest path_length_guess first
-            path_length_guess, _, vertex, path_edge_count = heappop(to_visit)
+            path_length_guess, _, vertex, path_edge_count = heap_pop(to_visit)
 
             # A vertex can get added to the heap multiple times.
 
@@ -312,7 +315,7 @@ class TraversalAStarFlex(
 
                 if not is_tree:
                     "$$ MVertexMapping.set('path_length_guesses', 'n_id', 'n_guess') $$"
-                heappush(
+                heap_push(
                     to_visit,
                     (n_guess, next(unique_no), neighbor, n_path_edge_count),
                 )
@@ -139,6 +139,9 @@ class TraversalMinimumSpanningTreeFlex(
         ]
         heapify(to_visit)
 
+        # Get references of used heap functions (avoid global name resolution)
+        heap_pop, heap_push = heappop, heappush
+
         "$$ MCalculationLimit.prepare() $$"
 
         # Get references of used gear objects and methods (avoid attribute resolution)
@@ -148,7 +151,7 @@ class TraversalMinimumSpanningTreeFlex(
 
         while to_visit:
             # Visit edge with the lowest weight first
-            _weight, _, vertex, to_edge = heappop(to_visit)
+            _weight, _, vertex, to_edge = heap_pop(to_visit)
             to_vertex = to_edge[0]
 
             # A vertex can get added to the heap multiple times, as end vertex of
@@ -187,7 +190,7 @@ class TraversalMinimumSpanningTreeFlex(
 
                 "$$ MVertexSet.if_visited_continue('visited', 'n_to_id', '') $$"
 
-                heappush(
+                heap_push(
                     to_visit,
                     (n_weight, next(unique_no), to_vertex, n_to_edge),
                 )
@@ -158,6 +158,9 @@ class TraversalShortestPathsFlex(
         # often faster. Here, we do it simply to do it the same way.
         unique_no = itertools.count(256, -1)
 
+        # Get references of used heap functions (avoid global name resolution)
+        heap_pop, heap_push = heappop, heappush
+
         # Get references of used gear objects and methods (avoid attribute resolution)
         distances = self.distances
         "$$ MVertexMapping.access('distances') $$"
@@ -179,7 +182,7 @@ class TraversalShortestPathsFlex(
 
         while to_visit:
             # Visit path with the lowest distance first
-            path_weight, _, vertex, path_edge_count = heappop(to_visit)
+            path_weight, _, vertex, path_edge_count = heap_pop(to_visit)
 
             # A vertex can get added to the heap multiple times. We want to process
             # it only once, the first time it is removed from the heap, because this
@@ -241,7 +244,7 @@ class TraversalShortestPathsFlex(
                                   'edge[-1]', from_edge=True)
                         $$"""
 
-                heappush(
+                heap_push(
                     to_visit,
                     (
                         n_path_weight,